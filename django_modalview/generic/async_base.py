@@ -0,0 +1,64 @@
+from inspect import iscoroutinefunction
+
+from asgiref.sync import sync_to_async
+
+from django_modalview.generic.base import (
+    ModalTemplateView,
+    ModalTemplateUtilView
+)
+
+
+class AsyncModalMixin(object):
+
+    """
+        Mixin that handles the GET request of a modal view with a coroutine,
+        for ASGI deployments (Django >= 4.1). The rendering runs in a
+        worker thread so the event loop is not blocked.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        if self.can_redirect():
+            return self.redirect_response()
+        context = self.get_context_modal_data(**kwargs)
+        return await sync_to_async(self.render_to_response)(context=context)
+
+
+class AsyncModalUtilMixin(AsyncModalMixin):
+
+    """
+        Mixin that runs the util method of a modal from a coroutine. The
+        util method can be a coroutine or a regular method.
+    """
+
+    async def aget_util(self, func_name, *args, **kwargs):
+        func = self._get_util_method(func_name)
+        util_kwargs = self.get_util_kwargs(**kwargs)
+        if iscoroutinefunction(func):
+            await func(*args, **util_kwargs)
+        else:
+            await sync_to_async(func)(*args, **util_kwargs)
+
+    async def get(self, request, *args, **kwargs):
+        self.util_button.url = self.get_util_url()
+        if self.request.GET.get('util'):
+            self._can_redirect = True
+            await self.aget_util(self.util_name, **self.kwargs)
+            self.template_name = self.content_template_name
+
+        return await super(AsyncModalUtilMixin, self).get(request, *args,
+                                                          **kwargs)
+
+
+class AsyncModalTemplateView(AsyncModalMixin, ModalTemplateView):
+
+    """
+            An async view that display a simple modal
+    """
+
+
+class AsyncModalTemplateUtilView(AsyncModalUtilMixin, ModalTemplateUtilView):
+
+    """
+            An async view that display a modal and that is able to handle an
+            util method.
+    """
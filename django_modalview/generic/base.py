@@ -1,3 +1,12 @@
+try:
+    from functools import lru_cache
+except ImportError:
+    from django.utils.lru_cache import lru_cache
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.functional import cached_property
+from django.utils.translation import get_language
 from django.middleware.csrf import get_token
 from django.template.loader import render_to_string
 from django.http import HttpResponse, HttpResponseRedirect
@@ -6,7 +15,9 @@ from django.views.generic.base import (View, TemplateResponseMixin)
 from django_modalview.generic.component import (
     ModalButton, GET_TEMPLATE,
     GET_TEMPLATE_CONTENT,
-    BASE_TEMPLATE
+    BASE_TEMPLATE,
+    CONTENT_PLACEHOLDER_TEMPLATE,
+    MODAL_CONTENT_PLACEHOLDER
 )
 
 from django_modalview.generic.response import (
@@ -15,6 +26,61 @@ from django_modalview.generic.response import (
     ModalJsonResponseReference
 )
 
+__all__ = (
+    'ModalContextMixin',
+    'ModalView',
+    'ModalTemplateResponseMixin',
+    'ModalTemplateMixin',
+    'ModalTemplateReferenceMixin',
+    'ModalUtilMixin',
+    'BaseModalView',
+    'ModalTemplateView',
+    'ModalTemplateUtilView',
+    'MissingUtilMethod',
+)
+
+# Header set by jQuery on ajax requests (what HttpRequest.is_ajax checked).
+AJAX_HEADER = 'HTTP_X_REQUESTED_WITH'
+AJAX_HEADER_VALUE = 'XMLHttpRequest'
+
+
+@lru_cache(maxsize=256)
+def _render_shell(template_name, base_template_name, modal_id, modal_size,
+                  language):
+    """
+        Render the static part of a modal (the shell around the content
+        template) once per set of arguments. The content template is replaced
+        by one that outputs MODAL_CONTENT_PLACEHOLDER. The language is only
+        part of the cache key, the shell is rendered in the active one.
+    """
+    return render_to_string(template_name, {
+        'base_template_name': base_template_name,
+        'modal_id': modal_id,
+        'modal_size': modal_size,
+        'content_template_name': CONTENT_PLACEHOLDER_TEMPLATE
+    })
+
+
+@receiver(setting_changed)
+def _clear_shell_cache(setting, **kwargs):
+    if setting in ('TEMPLATES', 'TEMPLATE_DIRS', 'TEMPLATE_LOADERS',
+                   'INSTALLED_APPS'):
+        _render_shell.cache_clear()
+
+
+def _clear_shell_cache_on_file_change(sender, file_path, **kwargs):
+    # Templates edited while the autoreloader runs are reloaded by Django
+    # without restarting the process.
+    _render_shell.cache_clear()
+
+
+try:
+    from django.utils.autoreload import file_changed
+except ImportError:
+    pass
+else:
+    file_changed.connect(_clear_shell_cache_on_file_change)
+
 
 class ModalContextMixin(object):
 
@@ -23,6 +89,16 @@ class ModalContextMixin(object):
         received by get_context_modal_data as the modal template context.
     """
 
+    title = "title"
+    description = ""
+    icon = None
+    response = None
+    content_template_name = None
+    base_template_name = BASE_TEMPLATE
+    # New options
+    modal_size = 'modal-md'
+    modal_id = 'generic-modal'
+
     def get_context_data(self, **kwargs):
         if 'view' not in kwargs:
             kwargs['view'] = self
@@ -30,60 +106,55 @@ class ModalContextMixin(object):
     
     def __init__(self, title=None, description=None, icon=None, *args, **kw):
         super(ModalContextMixin, self).__init__(*args, **kw)
-        
-        self.title = "title"
-        self.response = None
-        self.icon = icon
-        self.description = ""
+        if title is not None:
+            self.title = title
+        if description is not None:
+            self.description = description
+        if icon is not None:
+            self.icon = icon
         self.close_button = ModalButton('Close', button_type='primary')
-        self.content_template_name = None
-        self.base_template_name = BASE_TEMPLATE
-        
-        #  New options 
-        self.modal_size = kw.get('modal_size', 'modal-md')
-        self.modal_id = kw.get('modal_id', 'generic-modal')
-        # use to know if you can redirect. Disable for the first request.
+
+    def _fill_modal_context(self, context):
+        context['title'] = self.title
+        context['description'] = self.description
+        context['button_close'] = self.close_button
+        context['content_template_name'] = self.content_template_name
+        context['base_template_name'] = self.base_template_name
+        context['icon'] = self.icon
+        context['response'] = self.response
+        # New options in context
+        context['modal_size'] = self.modal_size
+        context['modal_id'] = self.modal_id
+        return context
 
     def _generate_modal_context(self):
-        return {
-            'title': self.title,
-            'description': self.description,
-            'button_close': self.close_button,
-            'content_template_name': self.content_template_name,
-            'base_template_name': self.base_template_name,
-            'icon': self.icon,
-            'response': self.response,
-            # New options in context
-            'modal_size': self.modal_size,
-            'modal_id': self.modal_id
-        }
+        return self._fill_modal_context({})
 
     def get_context_modal_data(self, **kwargs):
-        kwargs.update(self._generate_modal_context())
-        return kwargs
+        return self._fill_modal_context(kwargs)
 
 
 class ModalView(View):
 
     """
         Parent class of all the ModalView. Extends the Django generic View
-        to override the dispatch method and to overload the get method.
+        to know if the request is an ajax one and to overload the get method.
     """
 
-    def __init__(self, *args, **kwargs):
-        super(ModalView, self).__init__(*args, **kwargs)
-        self.is_ajax = False
-        self._can_redirect = False
-        self.redirect_to = None
+    # use to know if you can redirect. Disable for the first request.
+    _can_redirect = False
+    redirect_to = None
 
     def can_redirect(self):
         return self._can_redirect and self.redirect_to
 
-    def dispatch(self, request, *args, **kwargs):
-        self.is_ajax = request.is_ajax()
-        return super(ModalView, self).dispatch(request, *args, **kwargs)
+    @cached_property
+    def is_ajax(self):
+        return self.request.META.get(AJAX_HEADER) == AJAX_HEADER_VALUE
 
     def get(self, request, *args, **kwargs):
+        if self.can_redirect():
+            return self.redirect_response()
         context = self.get_context_modal_data(**kwargs)
         return self.render_to_response(
             context=context
@@ -102,11 +173,36 @@ class ModalTemplateResponseMixin(TemplateResponseMixin):
     json_response_redirect_class = ModalJsonResponseRedirect
     http_response_class = HttpResponse
     http_response_redirect_class = HttpResponseRedirect
+    # Render the modal shell once and cache it. Only enable it if the base
+    # template does not depend on the modal context.
+    cache_modal_shell = False
 
     def _valid_template(self):
         if not self.is_ajax:
             self.template_name = GET_TEMPLATE
 
+    def _can_cache_shell(self, template_names):
+        return (self.cache_modal_shell and
+                list(template_names) == [GET_TEMPLATE])
+
+    def _render_content(self, context):
+        template_names = self.get_template_names()
+        if not self._can_cache_shell(template_names):
+            # A single template name is loaded directly by the engine,
+            # a list would go through select_template.
+            if len(template_names) == 1:
+                template_names = template_names[0]
+            return render_to_string(template_names, context)
+
+        shell = _render_shell(GET_TEMPLATE, self.base_template_name,
+                              self.modal_id, self.modal_size, get_language())
+        if MODAL_CONTENT_PLACEHOLDER not in shell:
+            # The modal template is overridden and does not include the
+            # content template.
+            return render_to_string(GET_TEMPLATE, context)
+        content = render_to_string(self.content_template_name, context)
+        return shell.replace(MODAL_CONTENT_PLACEHOLDER, content, 1)
+
     def _get_content(self, context):
         """
             Add the csrf_token_value because the mixin use render_to_string
@@ -116,7 +212,7 @@ class ModalTemplateResponseMixin(TemplateResponseMixin):
         context.update({
             "csrf_token_value": get_token(self.request)
         })
-        return render_to_string(self.get_template_names(), context)
+        return self._render_content(context)
 
     def get_response(self):
 
@@ -131,6 +227,13 @@ class ModalTemplateResponseMixin(TemplateResponseMixin):
             else:
                 return self.http_response_redirect_class
 
+    def redirect_response(self):
+        """
+            Build the redirect response without rendering the modal.
+        """
+        if self.is_ajax:
+            return self.json_response_redirect_class(self.redirect_to)
+        return self.http_response_redirect_class(self.redirect_to)
 
 
 class ModalTemplateMixin(ModalTemplateResponseMixin):
@@ -138,10 +241,10 @@ class ModalTemplateMixin(ModalTemplateResponseMixin):
     def render_to_response(self, context):
         ResponseClass = self.get_response()
         if not self.can_redirect():
-            context.update(self.get_context_data())
+            context = self.get_context_data(**context)
             return ResponseClass(self._get_content(context))
         else:
-            return ResponseClass(self.redirect_to)
+            return self.redirect_response()
 
 
 
@@ -154,7 +257,7 @@ class ModalTemplateReferenceMixin(ModalTemplateResponseMixin):
 
         if not self.can_redirect():
             data = None
-            context.update(self.get_context_data())
+            context = self.get_context_data(**context)
 
             if self.object:
                 data = self.get_data_json(self.object)
@@ -162,9 +265,16 @@ class ModalTemplateReferenceMixin(ModalTemplateResponseMixin):
             return ResponseClass(self._get_content(context), data=data)
 
         else:
-            return ResponseClass(self.redirect_to)
+            return self.redirect_response()
+
+
+
 
+class MissingUtilMethod(NotImplementedError):
 
+    """
+        Raised when the util method run by a modal is not implemented.
+    """
 
 
 class ModalUtilMixin(object):
@@ -177,17 +287,23 @@ class ModalUtilMixin(object):
         super(ModalUtilMixin, self).__init__(*args, **kwargs)
         self.util_kwargs = {}
 
+    def _get_util_method(self, func_name):
+        func = getattr(self, func_name, None)
+        if func is None:
+            raise MissingUtilMethod("You should implement a method named"
+                                    " {name!r}".format(name=func_name))
+        return func
+
     def get_util(self, func_name, *args, **kwargs):
-        if hasattr(self, func_name):
-            util_kwargs = self.get_util_kwargs(**kwargs)
-            getattr(self, func_name)(*args, **self.util_kwargs)
-        else:
-            raise Exception("You should implement one method name"
-                            " {name}!".format(name=func_name))
+        func = self._get_util_method(func_name)
+        util_kwargs = self.get_util_kwargs(**kwargs)
+        func(*args, **util_kwargs)
 
     def get_util_kwargs(self, *args, **kwargs):
-        kwargs.update(self.request.GET)
-        self.util_kwargs.update(**kwargs)
+        util_kwargs = self.util_kwargs
+        util_kwargs.update(kwargs)
+        util_kwargs.update(self.request.GET.dict())
+        return util_kwargs
 
 
 class BaseModalView(ModalContextMixin, ModalView):
@@ -196,10 +312,8 @@ class BaseModalView(ModalContextMixin, ModalView):
             A base view to handle a simple modal
     """
 
-    def __init__(self, *args, **kwargs):
-        super(BaseModalView, self).__init__(*args, **kwargs)
-        self.template_name = GET_TEMPLATE
-        self.content_template_name = GET_TEMPLATE_CONTENT
+    template_name = GET_TEMPLATE
+    content_template_name = GET_TEMPLATE_CONTENT
 
 
 class ModalTemplateView(ModalTemplateMixin, BaseModalView):
@@ -208,6 +322,9 @@ class ModalTemplateView(ModalTemplateMixin, BaseModalView):
             A view that display a simple modal
     """
 
+    # TemplateResponseMixin.template_name comes first in the MRO.
+    template_name = GET_TEMPLATE
+
 
 class ModalTemplateUtilView(ModalUtilMixin, ModalTemplateView):
 
@@ -216,24 +333,22 @@ class ModalTemplateUtilView(ModalUtilMixin, ModalTemplateView):
             A new button is displayed in the modal to run the tool.
     """
 
+    util_name = 'util'
+
     def __init__(self, button=None, *args, **kwargs):
         super(ModalTemplateUtilView, self).__init__(*args, **kwargs)
         self.util_button = button if button else ModalButton('Run test')
-        self.util_name = 'util'
 
-    def dispatch(self, request, *args, **kwargs):
-        self.util_button.url = request.META['PATH_INFO'] + '?util=true'
-        return super(ModalTemplateUtilView, self).dispatch(request, *args,
-                                                           **kwargs)
+    def get_util_url(self):
+        return self.request.path + '?util=true'
 
     def get_context_modal_data(self, **kwargs):
-        kwargs.update({
-            'util_button': self.util_button
-        })
+        kwargs['util_button'] = self.util_button
         return super(ModalTemplateUtilView,
                      self).get_context_modal_data(**kwargs)
 
     def get(self, request, *args, **kwargs):
+        self.util_button.url = self.get_util_url()
         get_dict = self.request.GET
         if get_dict.get('util'):
             self._can_redirect = True
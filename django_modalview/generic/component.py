@@ -4,10 +4,16 @@ FORM_TEMPLATE = "django_modalview/modal.html"
 FORM_TEMPLATE_CONTENT = "django_modalview/modal_form_content.html"
 LAST_FORM_TEMPLATE = "django_modalview/form_content.html"
 BASE_TEMPLATE = "django_modalview/base.html"
+CONTENT_PLACEHOLDER_TEMPLATE = "django_modalview/modal_content_placeholder.html"
+
+# Marker rendered by CONTENT_PLACEHOLDER_TEMPLATE in the cached modal shell.
+MODAL_CONTENT_PLACEHOLDER = "__MODAL_CONTENT__"
 
 
 class ModalButton(object):
 
+    __slots__ = ('value', 'display', 'type', 'url', 'loading_value')
+
     def __init__(self, value=None, button_type='info',
                  display=True, url=None, loading_value="loading...", *args, **kwargs):
 
@@ -21,6 +27,8 @@ class ModalButton(object):
 
 class ModalResponse(object):
 
+    __slots__ = ('text', 'result')
+
     def __init__(self, text='Result', result='info'):
         self.text = text
         self.result = result
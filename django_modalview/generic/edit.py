@@ -35,12 +35,13 @@ class ModalEditContextMixin(ModalContextMixin):
 
     """
 
+    action = None
+    content_template_name = FORM_TEMPLATE_CONTENT
+    form_content_template_name = LAST_FORM_TEMPLATE
+
     def __init__(self, *args, **kwargs):
         super(ModalEditContextMixin, self).__init__(*args, **kwargs)
-        self.action = None
-        self.content_template_name = FORM_TEMPLATE_CONTENT
         self.submit_button = ModalButton(value='send', button_type='primary')
-        self.form_content_template_name = LAST_FORM_TEMPLATE
 
     def get_context_modal_data(self, **kwargs):
         
@@ -69,6 +70,8 @@ class ModalFormMixin(ModalEditContextMixin, FormMixin):
         return super(ModalFormMixin, self).get_context_modal_data(**kwargs)
 
     def _form_response(self, **kwargs):
+        if self.can_redirect():
+            return self.redirect_response()
         kwargs.update(self.get_context_modal_data())
         return self.render_to_response(context=kwargs)
 
@@ -177,6 +180,8 @@ class ProcessModalPostView(BaseProcessModalView):
     def post(self, request, *args, **kwargs):
         self.template_name = self.content_template_name
         self._can_redirect = True
+        if self.can_redirect():
+            return self.redirect_response()
         kwargs.update(self.get_context_modal_data())
         return self.render_to_response(context=kwargs)
 